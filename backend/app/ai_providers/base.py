@@ -7,7 +7,7 @@ enabling easy switching between different AI services (Gemini, OpenAI, etc.).
 
 from abc import ABC, abstractmethod
 from typing import Any, AsyncIterator, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class AIProviderConfig(BaseModel):
@@ -24,6 +24,8 @@ class AIProviderConfig(BaseModel):
 class AIMessage(BaseModel):
     """Represents a message in the conversation."""
 
+    model_config = ConfigDict(frozen=True)
+
     role: str  # "user", "assistant", "system"
     content: str
 
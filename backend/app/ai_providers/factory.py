@@ -5,6 +5,7 @@ This module provides a factory for creating AI provider instances
 based on configuration.
 """
 
+from functools import lru_cache
 from typing import Type
 from app.ai_providers.base import BaseAIProvider, AIProviderConfig
 from app.ai_providers.gemini_provider import GeminiProvider
@@ -118,9 +119,13 @@ class AIProviderFactory:
 
 
 # Convenience function for getting the default provider
+@lru_cache()
 def get_ai_provider() -> BaseAIProvider:
     """
-    Get the default AI provider based on settings.
+    Get the cached default AI provider based on settings.
+
+    The provider client is built once and reused, since creating it
+    configures the SDK and allocates a new HTTP client each time.
 
     Returns:
         AI provider instance
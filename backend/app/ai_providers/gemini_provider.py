@@ -76,15 +76,16 @@ class GeminiProvider(BaseAIProvider):
 
         # Add system prompt to first user message if provided
         first_user = True
+        last_index = len(messages) - 1
 
-        for msg in messages:
+        for index, msg in enumerate(messages):
             if msg.role == "user":
                 content = msg.content
                 if first_user and system_prompt:
                     content = f"{system_prompt}\n\n{content}"
                     first_user = False
 
-                if messages.index(msg) == len(messages) - 1:
+                if index == last_index:
                     current_message = content
                 else:
                     history.append({